@@ -1 +1,2 @@
 from .main import main as main_model_as_function
+from .main import run_sweep
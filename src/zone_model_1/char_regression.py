@@ -2,14 +2,21 @@
 # Danny Hopkin
 # Functions for computing HRR from char regression during the decay phase
 
+import math
+
+from numba import njit
+
+
+@njit(cache=True)
 def char_reg_HRR(char_density, regression_rate, char_HoC):
 
     char_reg_RHR = regression_rate * char_density * char_HoC
 
     return char_reg_RHR
 
+@njit(cache=True)
 def char_density(char_thick):
-    char_rho = 230 / (char_thick ** 0.5)
+    char_rho = 230 / math.sqrt(char_thick)
     return char_rho
 
 if __name__ == "__main__":
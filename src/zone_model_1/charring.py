@@ -6,7 +6,10 @@ Author
 Danny Hopkin (danny.hopkin@ofrconsultants.com)
 """
 
+import math
+
 import numpy as np
+from numba import njit
 
 try:
     from scipy.integrate import simpson as simps
@@ -27,14 +30,45 @@ def char_depth_integral(Temp: list[float], time: list[float]) -> float:
     :returns: The computed char depth [mm].
     """
     # Square the temperature values
-    T_squared = [x ** 2 for x in Temp]
+    Temp = np.asarray(Temp)
+    T_squared = Temp * Temp
     # Numerical integration using Simpson’s rule
     simps_T_squared = simps(T_squared, time)
     # Compute char depth
-    d_char = (simps_T_squared / 1.35e5) ** (1 / 1.6)
+    return char_depth_from_integral(simps_T_squared)
+
+
+@njit(cache=True)
+def char_depth_from_integral(simps_T2: float) -> float:
+    """
+    Compute the char depth from a precomputed time integral of squared temperature.
+
+    Allows the integral to be accumulated incrementally, e.g. one trapezoid per
+    time step, instead of re-integrating the full temperature history.
+
+    :param simps_T2: Integral of squared temperature over time [K^2·min].
+    :returns: The computed char depth [mm].
+    """
+    d_char = (simps_T2 / 1.35e5) ** (1 / 1.6)
     return d_char
 
 
+@njit(cache=True)
+def char_integral_increment(Temp_prev: float, Temp: float, dt: float) -> float:
+    """
+    Compute one trapezoid of the time integral of squared temperature.
+
+    Summing the increments over consecutive time steps gives the integral used
+    by :func:`char_depth_from_integral`.
+
+    :param Temp_prev: Temperature at the start of the time step [K].
+    :param Temp: Temperature at the end of the time step [K].
+    :param dt: Time step [min].
+    :returns: Increment of the integral of squared temperature [K^2·min].
+    """
+    return 0.5 * (Temp_prev * Temp_prev + Temp * Temp) * dt
+
+
 def standard_fire_curve(time_min: float) -> float:
     """
     Calculate the standard fire curve temperature at a given time.
@@ -48,7 +82,7 @@ def standard_fire_curve(time_min: float) -> float:
     :param time_min: Time in minutes since the start of the fire.
     :returns: Temperature [K] at the given time according to the standard fire curve.
     """
-    return (345.0 * np.log10((8.0 * time_min) + 1.0)) + 293.0
+    return (345.0 * math.log10((8.0 * time_min) + 1.0)) + 293.0
 
 
 if __name__ == "__main__":
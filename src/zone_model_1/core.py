@@ -6,9 +6,13 @@ Author
 Danny Hopkin (danny.hopkin@ofrconsultants.com)
 """
 
+import math
+
 import numpy as np
+from numba import njit
 
 
+@njit(cache=True)
 def q_o_c_calc(H_o: float, A_o: float, c_p: float, Tf: float, Tinf: float) -> float:
     """
     Calculate heat loss due to convective flow from openings (q_o_c).
@@ -24,6 +28,7 @@ def q_o_c_calc(H_o: float, A_o: float, c_p: float, Tf: float, Tinf: float) -> fl
     return q_o_c
 
 
+@njit(cache=True)
 def q_o_r_calc(A_o: float, Ef: float, Tf: float, Tinf: float) -> float:
     """
     Calculate heat loss by radiation through openings (q_o_r).
@@ -34,10 +39,14 @@ def q_o_r_calc(A_o: float, Ef: float, Tf: float, Tinf: float) -> float:
     :param Tinf: Ambient (external) temperature [K].
     :returns: Radiative heat loss through the opening [W].
     """
-    q_o_r = A_o * Ef * 5.67e-8 * ((Tf ** 4) - (Tinf ** 4))
+    # Fourth powers as products of squares, avoiding a pow call
+    Tf2 = Tf * Tf
+    Tinf2 = Tinf * Tinf
+    q_o_r = A_o * Ef * 5.67e-8 * ((Tf2 * Tf2) - (Tinf2 * Tinf2))
     return q_o_r
 
 
+@njit(cache=True)
 def q_w(Tf: float, Tw: float, hc: float, E_net: float) -> float:
     """
     Calculate heat flux to the wall (q_w) in [W/m^2].
@@ -51,10 +60,13 @@ def q_w(Tf: float, Tw: float, hc: float, E_net: float) -> float:
     :returns: Heat flux [W/m^2] to the wall.
     """
     q_w_conv = hc * (Tf - Tw)
-    q_w_rad = E_net * 5.67e-8 * ((Tf ** 4) - (Tw ** 4))
+    Tf2 = Tf * Tf
+    Tw2 = Tw * Tw
+    q_w_rad = E_net * 5.67e-8 * ((Tf2 * Tf2) - (Tw2 * Tw2))
     return q_w_conv + q_w_rad
 
 
+@njit(cache=True)
 def gas_energy_balance(HRR: float, Q_w: float, Q_o_c: float, Q_o_r: float) -> float:
     """
     Compute net energy stored in the gas by enclosure energy balance.
@@ -69,6 +81,7 @@ def gas_energy_balance(HRR: float, Q_w: float, Q_o_c: float, Q_o_r: float) -> fl
     return Q_gas
 
 
+@njit(cache=True)
 def delta_gas_temp(Q_gas: float, dt: float, rho_air: float, c_p: float, V_gas: float) -> float:
     """
     Calculate the change in lumped gas temperature.
@@ -84,6 +97,7 @@ def delta_gas_temp(Q_gas: float, dt: float, rho_air: float, c_p: float, V_gas: f
     return dT_gas
 
 
+@njit(cache=True)
 def wall_rad_hf(gas_volume: float, rad_fraction: float, HRR: float) -> float:
     """
     Calculate the radiant heat flux to the walls.
@@ -101,6 +115,7 @@ def wall_rad_hf(gas_volume: float, rad_fraction: float, HRR: float) -> float:
     return q_rad
 
 
+@njit(cache=True)
 def fire_emissivity(h: float) -> float:
     """
     Calculate fire emissivity as a function of characteristic height.
@@ -108,4 +123,4 @@ def fire_emissivity(h: float) -> float:
     :param h: Characteristic fire height [m].
     :returns: Fire emissivity [-].
     """
-    return 1 - np.exp(-1.1 * h)
+    return 1 - math.exp(-1.1 * h)
@@ -8,21 +8,19 @@ Danny Hopkin (danny.hopkin@ofrconsultants.com)
 """
 
 import numpy as np
+from numba import njit
 
 
+@njit(cache=True, fastmath=True)
 def update_wall_temp_array(
         T: np.ndarray,
         T_new: np.ndarray,
-        T_history: list[np.ndarray],
-        alpha: float,
-        dt: float,
-        dx: float,
+        r: float,
+        coef: float,
         h: float,
         Tg: float,
         epsilon: float,
         sigma: float,
-        rho: float,
-        c: float,
         N: int,
         q_inc: float
 ) -> np.ndarray:
@@ -34,58 +32,46 @@ def update_wall_temp_array(
     boundary conditions are imposed at the exposed surface, and an insulated
     boundary is assumed at the opposite surface.
 
+    Compiled with Numba; the caller is responsible for recording any
+    temperature history.
+
     :param T: Current temperature distribution [K] (1D array of length N).
     :param T_new: Array for storing updated temperature distribution [K].
-    :param T_history: List to which updated temperature distributions will be appended.
-    :param alpha: Thermal diffusivity [m^2/s].
-    :param dt: Time step [s].
-    :param dx: Spatial step [m].
+    :param r: Stencil coefficient, alpha * dt / dx^2 [-].
+    :param coef: Surface flux coefficient, dt / (rho * c * dx) [m^2·K/W].
     :param h: Convective heat transfer coefficient [W/(m^2·K)].
     :param Tg: Gas temperature [K].
     :param epsilon: Surface emissivity [-].
     :param sigma: Stefan-Boltzmann constant [W/(m^2·K^4)].
-    :param rho: Density of wall material [kg/m^3].
-    :param c: Specific heat capacity of wall material [J/(kg·K)].
     :param N: Number of nodes in the 1D discretization.
     :param q_inc: Incident radiant heat flux [W/m^2].
-    :returns: Updated temperature distribution [K] (1D array of length N).
+    :returns: Updated temperature distribution [K], i.e. ``T_new``.
     """
 
     # Interior nodes: apply the heat equation
     for i in range(1, N - 1):
-        T_new[i] = T[i] + alpha * dt / dx ** 2 * (T[i + 1] - 2 * T[i] + T[i - 1])
+        T_new[i] = T[i] + r * (T[i + 1] - 2.0 * T[i] + T[i - 1])
 
     # Boundary condition at exposed surface (x = 0)
     # Calculate absorbed heat flux
     q_abs_conv_gas = h * (Tg - T[0])
-    q_abs_rad_gas = epsilon * sigma * (Tg ** 4 - T[0] ** 4)
-    q_abs_rad_flame = q_inc - (sigma * (T[0] ** 4 - 293 ** 4)) - (h * (T[0] - 293))
+    Tg2 = Tg * Tg
+    Ts2 = T[0] * T[0]
+    q_abs_rad_gas = epsilon * sigma * (Tg2 * Tg2 - Ts2 * Ts2)
 
     T_new[0] = T[0] + (
             (
                     q_abs_conv_gas
                     + q_abs_rad_gas
                     + q_inc
-            ) * dt / (rho * c * dx)
-            + alpha * dt / dx ** 2 * (T[1] - T[0])
+            ) * coef
+            + r * (T[1] - T[0])
     )
 
-    # T_new[0] = T[0] + (
-    #         (
-    #                 h * (Tg - T[0])
-    #                 + epsilon * sigma * (Tg ** 4 - T[0] ** 4)
-    #                 + q_inc
-    #         ) * dt / (rho * c * dx)
-    #         + alpha * dt / dx ** 2 * (T[1] - T[0])
-    # )
-
     # Boundary condition at insulated surface (x = L)
-    T_new[N - 1] = T[N - 1] + alpha * dt / dx ** 2 * (T[N - 2] - T[N - 1])
+    T_new[N - 1] = T[N - 1] + r * (T[N - 2] - T[N - 1])
 
-    # Update the temperature array and record the new distribution
-    T = T_new.copy()
-    T_history.append(T.copy())
-    return T
+    return T_new
 
 
 def ht_dx_dt_sub(L: float, N: int, alpha: float) -> tuple[float, float]:
@@ -152,9 +138,15 @@ if __name__ == "__main__":
     # Record temperature profiles over time for visualization
     T_history = []
 
+    # Stencil and surface flux coefficients
+    r = alpha * dt / (dx * dx)
+    coef = dt / (rho * c * dx)
+
     # Finite difference time-stepping
     for _ in range(time_steps):
-        T = update_wall_temp_array(T, T_new, T_history, alpha, dt, dx, h, Tg, epsilon, sigma, rho, c, N, q_inc)
+        update_wall_temp_array(T, T_new, r, coef, h, Tg, epsilon, sigma, N, q_inc)
+        T, T_new = T_new, T
+        T_history.append(T.copy())
     # ----------------------------------------------------------------------------------------------------------------------
     # Plotting the temperature distribution over time
     plt.figure(figsize=(10, 6))
@@ -7,7 +7,7 @@ Danny Hopkin (danny.hopkin@ofrconsultants.com)
 """
 
 # import localised fire modules
-from localised_fire import get_localised_fire
+from zone_model_1.localised_fire import get_localised_fire
 
 def hrr_flash(At: float, Av: float, Hv: float) -> float:
     """
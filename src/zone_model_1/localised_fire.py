@@ -6,6 +6,8 @@ flame length, virtual origin, and localised flame temperature, based on
 heat release rate (HRR) and other fire characteristics.
 """
 
+import math
+
 import numpy as np
 
 
@@ -46,8 +48,8 @@ def local_flame_temp(HRR: float, conv_fract: float, z: float, z_o: float) -> flo
     :returns: Flame temperature [°C].
     """
     HRR_conv = HRR * conv_fract
-    local_temp = 20 + (0.25 * (HRR_conv ** 0.66667) * ((z - z_o) ** (-5 / 3)))
-    local_temp = min(local_temp, 900)
+    local_temp = 20 + (0.25 * math.pow(HRR_conv, 2.0 / 3.0) / math.pow(z - z_o, 5.0 / 3.0))
+    local_temp = min(local_temp, 900.0)
     return local_temp
 
 
@@ -82,6 +84,36 @@ def get_localised_fire(HRR: float, HRRPUA: float, conv_fract: float, z: float) -
     return lf, local_temp
 
 
+def get_localised_fire_batch(
+        HRR_arr: np.ndarray | float, HRRPUA: float, conv_fract: float, z_arr: np.ndarray | float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised version of :func:`get_localised_fire` for many HRR values and/or heights.
+
+    ``HRR_arr`` and ``z_arr`` are broadcast against each other, so a sweep over
+    heights for one HRR, or over HRRs at one height, is a single call.
+
+    :param HRR_arr: Heat release rate(s) [W].
+    :param HRRPUA: Heat release rate per unit area [W/m^2].
+    :param conv_fract: Convective fraction of the heat release rate [-].
+    :param z_arr: Vertical position(s) for temperature evaluation [m].
+    :returns: A tuple ``(flame_length, local_flame_temperature)`` of writable arrays with the
+              broadcast shape of ``HRR_arr`` and ``z_arr`` (0-d for scalar inputs).
+    """
+    HRR = np.asarray(HRR_arr, dtype=np.float64)
+    z = np.asarray(z_arr, dtype=np.float64)
+
+    diam = fire_dia(HRR, HRRPUA)
+    lf = flame_length(HRR, diam)
+    z_o = virt_orig(HRR, diam)
+
+    # Array form of local_flame_temp, which uses scalar math and min
+    local_temp = 20 + (0.25 * (HRR * conv_fract) ** (2.0 / 3.0) / (z - z_o) ** (5.0 / 3.0))
+    local_temp = np.minimum(local_temp, 900.0)
+    lf, local_temp = np.broadcast_arrays(lf, local_temp)
+    return lf.copy(), local_temp.copy()
+
+
 if __name__ == "__main__":
     HRR = 2000000
     HRRPUA = 250000
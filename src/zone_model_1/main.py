@@ -3,15 +3,19 @@ This module provides a single entry point to access the fire model
 without post-processing using matplotlib.
 """
 
+import inspect
+import os
+from functools import lru_cache
+
 import numpy as np
-from scipy.interpolate import interp1d
 from scipy.ndimage import gaussian_filter1d
 from tqdm import tqdm
 import pandas as pd
+from numba import njit, prange
 
 import zone_model_1.hrr as RHR
 from zone_model_1.char_regression import char_reg_HRR, char_density
-from zone_model_1.charring import char_depth_integral
+from zone_model_1.charring import char_depth_from_integral, char_integral_increment
 from zone_model_1.core import (
     q_o_c_calc,
     q_o_r_calc,
@@ -24,6 +28,293 @@ from zone_model_1.core import (
 from zone_model_1.heat_transfer_1d_plus_qinc import alpha_calc, ht_dx_dt_sub, update_wall_temp_array
 
 
+# Scalar arguments of _simulate_core, in signature order, as packed per case by run_sweep. _simulate_sweep
+# passes them by position, tests/main.py checks the order
+_KERNEL_SCALARS = (
+    'dt', 'r_wall', 'coef_wall', 'r_ceil', 'coef_ceil', 'r_floor', 'coef_floor',
+    'HRR_VC_lim', 'conv_fract', 'ceiling_ignition_time', 'ceiling_exposed', 'wood_Hoc', 'wood_density', 'char_HoC',
+    'k_opening_conv', 'k_opening_rad', 'k_wall_rad', 'k_gas_temp', 'wall_area', 'ceiling_area', 'floor_area',
+    'T_inf', 'E_net', 'hc', 'sigma',
+)
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_core(
+        i_start: int, i_stop: int, T_f: float, MLR: float, char_rho: float, T2_integral: float,
+        T: np.ndarray, T_ceil: np.ndarray, T_floor: np.ndarray,
+        output_time_arr: np.ndarray, output_gas_temp_arr: np.ndarray, output_char_depth_arr: np.ndarray,
+        output_charring_rate_arr: np.ndarray, output_MLR_arr: np.ndarray, output_HRR_wood_arr: np.ndarray,
+        output_HRR_total_arr: np.ndarray, output_HRR_ext_arr: np.ndarray,
+        HRR_at_step: np.ndarray, Reg_rate_at_step: np.ndarray,
+        N: int, N_ceil: int, N_floor: int,
+        dt: float, r_wall: float, coef_wall: float, r_ceil: float, coef_ceil: float, r_floor: float, coef_floor: float,
+        HRR_VC_lim: float, conv_fract: float, ceiling_ignition_time: float, ceiling_exposed: float, wood_Hoc: float,
+        wood_density: float, char_HoC: float,
+        k_opening_conv: float, k_opening_rad: float, k_wall_rad: float, k_gas_temp: float,
+        wall_area: float, ceiling_area: float, floor_area: float,
+        T_inf: float, E_net: float, hc: float, sigma: float,
+) -> tuple[float, float, float, float]:
+    """
+    Advance the zone model from step ``i_start`` up to (excluding) ``i_stop``.
+
+    Compiled with Numba. Boundary temperatures are double-buffered ``(2, N)``
+    arrays holding step ``i`` in row ``i % 2``, so no copy is made between
+    steps. They and all ``output_*`` arrays are updated in place at each
+    step index. The ``k_*`` arguments are the loop-invariant factors of the
+    linear ``core`` relations, see :func:`_prepare_case`. Arguments
+    otherwise follow the naming used in :func:`main`.
+
+    :returns: The carried-over state ``(T_f, MLR, char_rho, T2_integral)``.
+    """
+    dt_min = dt / 60.0
+
+    for i in range(i_start, i_stop):
+        time_s = i * dt
+        cur = (i - 1) % 2
+        new = i % 2
+        HRR_content = HRR_at_step[i]  # W
+
+        Reg_rate = Reg_rate_at_step[i]  # m/s
+
+        if time_s > ceiling_ignition_time:
+            HRR_char_reg = char_reg_HRR(char_rho, Reg_rate, char_HoC * 1000) * ceiling_area * ceiling_exposed
+            HRR_struct = MLR * wood_Hoc * ceiling_area * ceiling_exposed * 1000.0  # Convert kW to W
+            HRR_wood = HRR_struct + HRR_char_reg
+
+        else:
+            HRR_wood = 0.0
+
+        # Limit total HRR by ventilation
+        HRR_total = min(HRR_wood + HRR_content, HRR_VC_lim)
+        HRR_total = max(HRR_total, 0.0)
+
+        # Excess HRR escapes externally
+        HRR_ext = max(0.0, (HRR_wood + HRR_content) - HRR_VC_lim)
+
+        # Fraction of HRR that is convective
+        HRR_conv = HRR_total * conv_fract
+
+        # Incident radiation on walls (fraction that is radiative, minus fire emissivity)
+        q_rad_wall = k_wall_rad * HRR_conv  # * (1.0 - Ef)
+
+        # Update boundary temperatures
+        # Walls
+        update_wall_temp_array(T[cur], T[new], r_wall, coef_wall, hc, T_f, E_net, sigma, N, q_rad_wall)
+        Ts_wall = T[new, 0]
+
+        # ceiling
+        update_wall_temp_array(T_ceil[cur], T_ceil[new], r_ceil, coef_ceil, hc, T_f, E_net, sigma, N_ceil, q_rad_wall)
+        Ts_ceil = T_ceil[new, 0]
+
+        # floor
+        update_wall_temp_array(T_floor[cur], T_floor[new], r_floor, coef_floor, hc, T_f, E_net, sigma, N_floor, q_rad_wall)
+        Ts_floor = T_floor[new, 0]
+
+        # Openings: convective & radiative losses
+        Q_o_c = k_opening_conv * (T_f - T_inf)
+        T_f2 = T_f * T_f
+        Q_o_r = k_opening_rad * T_f2 * T_f2
+
+        # Heat loss to walls
+        Q_w_walls = q_w(T_f, Ts_wall, hc, E_net) * wall_area
+        Q_w_ceiling = q_w(T_f, Ts_ceil, hc, E_net) * ceiling_area
+        Q_w_floor = q_w(T_f, Ts_floor, hc, E_net) * floor_area
+        Q_w_total = Q_w_walls + Q_w_ceiling + Q_w_floor
+
+        # Gas energy balance & temperature update
+        Q_gas = gas_energy_balance(HRR_conv, Q_w_total, Q_o_c, Q_o_r)
+        dT_gas = k_gas_temp * Q_gas
+        T_f_prev = T_f
+        T_f = max(293.0, T_f + dT_gas)
+
+        # Store results
+        output_time_arr[i] = time_s
+        output_gas_temp_arr[i] = T_f
+
+        # Compute char depth, accumulating the integral by one trapezoid per step
+        T2_integral += char_integral_increment(T_f_prev, T_f, dt_min)
+        output_char_depth_arr[i] = char_depth_from_integral(T2_integral)
+
+        if time_s < ceiling_ignition_time:
+            charring_rate = 0.0
+        else:
+            charring_rate = (output_char_depth_arr[i] - output_char_depth_arr[i - 1]) / dt_min
+            # Update char density
+            char_rho = char_density(output_char_depth_arr[i])
+        output_charring_rate_arr[i] = charring_rate
+
+        # Mass loss rate
+        MLR = (charring_rate / (60.0 * 1000.0)) * wood_density
+        output_MLR_arr[i] = MLR
+
+        # Store HRR data
+        output_HRR_wood_arr[i] = HRR_wood
+        output_HRR_total_arr[i] = HRR_total
+        output_HRR_ext_arr[i] = HRR_ext
+
+    return T_f, MLR, char_rho, T2_integral
+
+
+@lru_cache(maxsize=None)
+def _read_hrr_input(path: str, mtime: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read a prescribed HRR curve from an Excel file, caching the result.
+
+    :param path: Path of the Excel file, with ``Time_s`` and ``HRR_kW`` columns.
+    :param mtime: Modification time of the file, so that the cache is refreshed when it changes.
+    :returns: Read-only arrays ``(HRR_time_arr, HRR_hrr_arr)`` in [s] and [kW].
+    """
+    df_input_HRR = pd.read_excel(path)
+    HRR_time_arr = df_input_HRR['Time_s'].to_numpy(dtype=np.float64)
+    HRR_hrr_arr = df_input_HRR['HRR_kW'].to_numpy(dtype=np.float64)
+    HRR_time_arr.flags.writeable = False
+    HRR_hrr_arr.flags.writeable = False
+    return HRR_time_arr, HRR_hrr_arr
+
+
+def _prepare_case(
+        b: float, d: float, h: float, H_o: float, B_o: float, T_inf: float, T_f: float,
+        wood_density: float, wood_Hoc: float, ceiling_exposed: float, regress: float, char_HoC: float,
+        c_p: float, E_net: float, rho_air: float,
+        growth_rate: float, HRRPUA: float, FLED: float, FLED_combustion_eff: float, conv_fract: float,
+        k: float, rho: float, c: float, T0_wall: float, L: float, N: int,
+        k_ceil: float, rho_ceil: float, c_ceil: float, T0_ceil: float, L_ceil: float, N_ceil: int,
+        k_floor: float, rho_floor: float, c_floor: float, T0_floor: float, L_floor: float, N_floor: int,
+        hc: float, sigma: float,
+) -> tuple[dict, np.ndarray, np.ndarray]:
+    """
+    Pre-process one set of :func:`main` inputs for the compiled time-stepping kernel.
+
+    Parameters are as for :func:`main`.
+
+    :returns: A tuple ``(case, HRR_time_arr, HRR_hrr_arr)``:
+       - case: Initialised arguments of :func:`_simulate_core`, keyed by name, other than ``i_start`` and
+         ``i_stop``, plus the number of time steps ``n_steps``.
+       - HRR_time_arr: Times of the contents HRR curve [s].
+       - HRR_hrr_arr: Contents HRR at those times [W].
+    """
+    # Calculate fire emissivity based on height
+    Ef = fire_emissivity(h)
+
+    # Calculate thermal diffusivity
+    alpha_wall = alpha_calc(k, rho, c)
+    alpha_ceil = alpha_calc(k_ceil, rho_ceil, c_ceil)
+    alpha_floor = alpha_calc(k_floor, rho_floor, c_floor)
+
+    # Initialize double-buffered temperature arrays for boundaries, step i is held in row i % 2
+    # Walls
+    T = np.ones((2, N)) * T0_wall
+
+    # Ceiling
+    T_ceil = np.ones((2, N_ceil)) * T0_ceil
+
+    # Floor
+    T_floor = np.ones((2, N_floor)) * T0_floor
+
+    # Enclosure geometry
+    opening_area = H_o * B_o
+    wall_area = (2.0 * (b + d) * h) - opening_area
+    ceiling_area = b * d
+    floor_area = b * d
+    gas_volume = b * d * h
+
+    # Fire load relationship
+    HRR_prescribed = 'yes'
+    # Calculate HRR with time
+    HRR_time_arr, HRR_hrr_arr, ceiling_ignition_time, start_dec, end_dec = RHR.time_vs_hrr(b, d, h, H_o, B_o, HRRPUA, growth_rate, FLED * FLED_combustion_eff, conv_fract)
+
+    # Option to prescribe HRR with time
+    if HRR_prescribed =='yes':
+        path = os.path.abspath("Input.xlsx")
+        HRR_time_arr, HRR_hrr_arr = _read_hrr_input(path, os.path.getmtime(path))
+        start_dec = 3585
+        end_dec = 5400
+
+
+    HRR_hrr_arr = np.asarray(HRR_hrr_arr, dtype=np.float64) * 1000.0  # Convert kW to W
+    HRR_VC_lim = RHR.vent_cont_hrr(opening_area, H_o) * 1000  # Ventilation-controlled limit in W
+
+    # Check end time
+    end_time = HRR_time_arr[-1]
+
+    # Char surface regression interp
+    char_reg_time_arr = np.array([0.0, start_dec, end_dec, end_time])
+    char_reg_rate_arr = np.array([0.0, 0.0, regress, regress])
+
+    # Define spatial and time steps
+    dx_wall, dt1 = ht_dx_dt_sub(L, N, alpha_wall)
+    dx_ceil, dt2 = ht_dx_dt_sub(L_ceil, N_ceil, alpha_ceil)
+    dx_floor, dt3 = ht_dx_dt_sub(L_floor, N_floor, alpha_floor)
+    dt = min(dt1, dt2, dt3)
+
+    # Stencil (alpha * dt / dx^2) and surface flux (dt / (rho * c * dx)) coefficients
+    r_wall = alpha_wall * dt / (dx_wall * dx_wall)
+    r_ceil = alpha_ceil * dt / (dx_ceil * dx_ceil)
+    r_floor = alpha_floor * dt / (dx_floor * dx_floor)
+    coef_wall = dt / (rho * c * dx_wall)
+    coef_ceil = dt / (rho_ceil * c_ceil * dx_ceil)
+    coef_floor = dt / (rho_floor * c_floor * dx_floor)
+
+    # Loop-invariant factors of the relations that are linear in the time-varying quantity
+    k_opening_conv = q_o_c_calc(H_o, opening_area, c_p, 1.0, 0.0)  # Q_o_c per K of T_f - T_inf
+    k_opening_rad = q_o_r_calc(opening_area, Ef, 1.0, 0.0)  # Q_o_r per T_f^4, with Tinf = 0
+    k_wall_rad = wall_rad_hf(gas_volume, (1.0 - conv_fract), 1.0)  # Incident flux per W of convective HRR
+    k_gas_temp = delta_gas_temp(1.0, dt, rho_air, c_p, gas_volume)  # Gas temperature rise per W
+
+    steps = end_time / dt
+    n_steps = round(steps)
+
+    # Sample the prescribed HRR and char regression rate once at every simulation time step
+    step_times = np.arange(n_steps + 1) * dt
+    HRR_at_step = np.interp(step_times, HRR_time_arr, HRR_hrr_arr)
+    Reg_rate_at_step = np.interp(step_times, char_reg_time_arr, char_reg_rate_arr) / (60 * 1000)
+
+    # Initialize output arrays
+    output_time_arr = np.empty(n_steps + 1)
+    output_gas_temp_arr = np.empty(n_steps + 1)
+    output_char_depth_arr = np.empty(n_steps + 1)
+    output_charring_rate_arr = np.empty(n_steps + 1)
+    output_MLR_arr = np.empty(n_steps + 1)
+    output_HRR_wood_arr = np.empty(n_steps + 1)
+    output_HRR_total_arr = np.empty(n_steps + 1)
+    output_HRR_ext_arr = np.empty(n_steps + 1)
+
+    # Populate with initial values
+    output_time_arr[0] = 0.0
+    output_gas_temp_arr[0] = T_f
+    output_char_depth_arr[0] = 0.0
+    output_charring_rate_arr[0] = 0.0
+    output_MLR_arr[0] = 0.0
+    output_HRR_wood_arr[0] = 0.0
+    output_HRR_total_arr[0] = 0.0
+    output_HRR_ext_arr[0] = 0.0
+
+    # Initialize variables
+    case = dict(
+        n_steps=n_steps, T_f=float(T_f), MLR=0.0, char_rho=0.0, T2_integral=0.0,
+        T=T, T_ceil=T_ceil, T_floor=T_floor,
+        output_time_arr=output_time_arr, output_gas_temp_arr=output_gas_temp_arr,
+        output_char_depth_arr=output_char_depth_arr, output_charring_rate_arr=output_charring_rate_arr,
+        output_MLR_arr=output_MLR_arr, output_HRR_wood_arr=output_HRR_wood_arr,
+        output_HRR_total_arr=output_HRR_total_arr, output_HRR_ext_arr=output_HRR_ext_arr,
+        HRR_at_step=HRR_at_step, Reg_rate_at_step=Reg_rate_at_step,
+        N=N, N_ceil=N_ceil, N_floor=N_floor,
+    )
+    # Loop-invariant scalars
+    scalars = dict(
+        dt=dt, r_wall=r_wall, coef_wall=coef_wall, r_ceil=r_ceil, coef_ceil=coef_ceil,
+        r_floor=r_floor, coef_floor=coef_floor,
+        HRR_VC_lim=HRR_VC_lim, conv_fract=conv_fract, ceiling_ignition_time=ceiling_ignition_time,
+        ceiling_exposed=ceiling_exposed, wood_Hoc=wood_Hoc, wood_density=wood_density, char_HoC=char_HoC,
+        k_opening_conv=k_opening_conv, k_opening_rad=k_opening_rad, k_wall_rad=k_wall_rad, k_gas_temp=k_gas_temp,
+        wall_area=wall_area, ceiling_area=ceiling_area, floor_area=floor_area,
+        T_inf=T_inf, E_net=E_net, hc=hc, sigma=sigma,
+    )
+    case.update((name, float(scalars[name])) for name in _KERNEL_SCALARS)
+
+    return case, HRR_time_arr, HRR_hrr_arr
+
+
 def main(
         # Set initial conditions
         b: float = 3.4,  # Room breadth [m]
@@ -111,204 +402,157 @@ def main(
     :param L: Thickness of the plasterboard [m].
     :param N: Number of 1D spatial nodes through the wall thickness.
     :param sigma: Stefan-Boltzmann constant [W/(m^2·K^4)].
-    :returns: A tuple containing simulation results in the following order:
+    :returns: A tuple of 1D float64 arrays containing simulation results in the following order:
               (time_arr [min], gas_temp_arr [°C], char_depth_arr [mm],
               charring_rate_arr [mm/min], MLR_arr [kg/(m^2·s)], HRR_wood_arr [W],
-              HRR_contents_arr [W], HRR_total_arr [W], HRR_external_arr [W]).
+              HRR_total_arr [W], HRR_external_arr [W], HRR_contents_time_arr [min],
+              HRR_contents_arr [W]). The first eight have one entry per time step,
+              including the initial state; the last two give the contents HRR curve.
     """
-    # Calculate fire emissivity based on height
-    Ef = fire_emissivity(h)
-
-    # Calculate thermal diffusivity
-    alpha_wall = alpha_calc(k, rho, c)
-    alpha_ceil = alpha_calc(k_ceil, rho_ceil, c_ceil)
-    alpha_floor = alpha_calc(k_floor, rho_floor, c_floor)
-
-    # Initialize temperature arrays for boundaries
-    # Walls
-    T = np.ones(N) * T0_wall
-    T_new = T.copy()
-
-    # Ceiling
-    T_ceil = np.ones(N_ceil) * T0_ceil
-    T_ceil_new = T_ceil.copy()
-
-    # Floor
-    T_floor = np.ones(N_floor) * T0_floor
-    T_floor_new = T_floor.copy()
-
-    # Arrays to record boundary temperature history
-    T_history = []
-    T_ceil_history = []
-    T_floor_history = []
-
-    # Enclosure geometry
-    opening_area = H_o * B_o
-    wall_area = (2.0 * (b + d) * h) - opening_area
-    ceiling_area = b * d
-    floor_area = b * d
-    gas_volume = b * d * h
-
-    # Fire load relationship
-    HRR_prescribed = 'yes'
-    # Calculate HRR with time
-    HRR_time_arr, HRR_hrr_arr, ceiling_ignition_time, start_dec, end_dec = RHR.time_vs_hrr(b, d, h, H_o, B_o, HRRPUA, growth_rate, FLED * FLED_combustion_eff, conv_fract)
-
-    # Option to prescribe HRR with time
-    if HRR_prescribed =='yes':
-        df_input_HRR = pd.read_excel("Input.xlsx")
-        HRR_time_arr = df_input_HRR['Time_s']
-        HRR_time_arr = HRR_time_arr.tolist()
-        HRR_hrr_arr = df_input_HRR['HRR_kW']
-        start_dec = 3585
-        end_dec = 5400
-
-
-    HRR_hrr_arr = [x * 1000 for x in HRR_hrr_arr]  # Convert kW to W
-    HRR_interp = interp1d(HRR_time_arr, HRR_hrr_arr, kind="linear", fill_value="extrapolate")
-    HRR_VC_lim = RHR.vent_cont_hrr(opening_area, H_o) * 1000  # Ventilation-controlled limit in W
-
-    # Check end time
-    end_time = HRR_time_arr[-1]
-
-    # Char surface regression interp
-    char_reg_time_arr = [0, start_dec, end_dec, end_time]
-    char_reg_rate_arr = [0, 0, regress, regress]
-    char_reg_interp = interp1d(char_reg_time_arr, char_reg_rate_arr, kind="linear", fill_value="extrapolate")
-
-    # Define spatial and time steps
-    dx_wall, dt1 = ht_dx_dt_sub(L, N, alpha_wall)
-    dx_ceil, dt2 = ht_dx_dt_sub(L_ceil, N_ceil, alpha_ceil)
-    dx_floor, dt3 = ht_dx_dt_sub(L_floor, N_floor, alpha_floor)
-    dt = min(dt1, dt2, dt3)
-
-    steps = end_time / dt
-    print("Number of steps:", round(steps))
-
-    # Initialize output arrays
-    output_time_arr = []
-    output_gas_temp_arr = []
-    output_char_depth_arr = np.array([0])
-    output_charring_rate_arr = []
-    output_MLR_arr = []
-    output_HRR_wood_arr = []
-    output_HRR_total_arr = []
-    output_HRR_ext_arr = []
-
-    # Populate with initial values
-    output_time_arr.append(0.0)
-    output_gas_temp_arr.append(T_f)
-    output_charring_rate_arr.append(0.0)
-    output_MLR_arr.append(0.0)
-    output_HRR_wood_arr.append(0.0)
-    output_HRR_total_arr.append(0.0)
-    output_HRR_ext_arr.append(0.0)
-
-    # Initialize variables
-    MLR = 0.0
-    char_rho = 0
-
-    # Main time-stepping loop
-    for i in tqdm(range(1, round(steps) + 1)):
-        time_s = i * dt
-        HRR_content = HRR_interp(time_s)  # W
-
-        # Lookup char regression rate
-        Reg_rate = char_reg_interp(time_s) / (60 * 1000)
-
-        if time_s > ceiling_ignition_time:
-            HRR_char_reg = char_reg_HRR(char_rho, Reg_rate, char_HoC * 1000) * ceiling_area * ceiling_exposed
-            HRR_struct = MLR * wood_Hoc * ceiling_area * ceiling_exposed * 1000.0  # Convert kW to W
-            HRR_wood = HRR_struct + HRR_char_reg
-
-        else:
-            HRR_wood = 0
-
-        # Limit total HRR by ventilation
-        HRR_total = min(HRR_wood + HRR_content, HRR_VC_lim)
-        HRR_total = max(HRR_total, 0.0)
-
-        # Excess HRR escapes externally
-        HRR_ext = max(0.0, (HRR_wood + HRR_content) - HRR_VC_lim)
-
-        # Fraction of HRR that is convective
-        HRR_conv = HRR_total * conv_fract
-
-        # Incident radiation on walls (fraction that is radiative, minus fire emissivity)
-        q_rad_wall = wall_rad_hf(gas_volume, (1.0 - conv_fract), HRR_conv) #* (1.0 - Ef)
-
-        # Update boundary temperatures
-        # Walls
-        T = update_wall_temp_array(T, T_new, T_history, alpha_wall, dt, dx_wall, hc, T_f, E_net, sigma, rho, c, N, q_rad_wall)
-        Ts_wall = T[0]
+    case, HRR_time_arr, HRR_hrr_arr = _prepare_case(
+        b=b, d=d, h=h, H_o=H_o, B_o=B_o, T_inf=T_inf, T_f=T_f,
+        wood_density=wood_density, wood_Hoc=wood_Hoc, ceiling_exposed=ceiling_exposed, regress=regress,
+        char_HoC=char_HoC,
+        c_p=c_p, E_net=E_net, rho_air=rho_air,
+        growth_rate=growth_rate, HRRPUA=HRRPUA, FLED=FLED, FLED_combustion_eff=FLED_combustion_eff,
+        conv_fract=conv_fract,
+        k=k, rho=rho, c=c, T0_wall=T0_wall, L=L, N=N,
+        k_ceil=k_ceil, rho_ceil=rho_ceil, c_ceil=c_ceil, T0_ceil=T0_ceil, L_ceil=L_ceil, N_ceil=N_ceil,
+        k_floor=k_floor, rho_floor=rho_floor, c_floor=c_floor, T0_floor=T0_floor, L_floor=L_floor,
+        N_floor=N_floor,
+        hc=hc, sigma=sigma,
+    )
+    n_steps = case.pop('n_steps')
+    print("Number of steps:", n_steps)
+
+    # Main time-stepping loop, advanced by the compiled kernel in chunks so progress can be reported,
+    # the progress bar is disabled when not writing to a terminal
+    chunk = max(1, n_steps // 100)
+    with tqdm(total=n_steps, disable=None) as progress:
+        for i_start in range(1, n_steps + 1, chunk):
+            i_stop = min(i_start + chunk, n_steps + 1)
+            case['T_f'], case['MLR'], case['char_rho'], case['T2_integral'] = _simulate_core(
+                i_start, i_stop, **case
+            )
+            progress.update(i_stop - i_start)
+
+    # Smooth char depth array
+    output_char_depth_arr = gaussian_filter1d(case['output_char_depth_arr'], sigma=1.5)
 
-        # ceiling
-        T_ceil = update_wall_temp_array(T_ceil, T_ceil_new, T_ceil_history, alpha_ceil, dt, dx_ceil, hc, T_f, E_net, sigma, rho_ceil, c_ceil, N_ceil, q_rad_wall)
-        Ts_ceil = T_ceil[0]
+    # Plot output
+    output_time_arr = case['output_time_arr'] / 60.0
+    output_gas_temp_arr = case['output_gas_temp_arr'] - 273.0
+    HRR_time_arr = np.asarray(HRR_time_arr, dtype=np.float64) / 60.0
 
-        # floor
-        T_floor = update_wall_temp_array(T_floor, T_floor_new, T_floor_history, alpha_floor, dt, dx_floor, hc, T_f, E_net, sigma, rho_floor, c_floor, N_floor, q_rad_wall)
-        Ts_floor = T_floor[0]
+    return (
+        output_time_arr,
+        output_gas_temp_arr,
+        output_char_depth_arr,
+        case['output_charring_rate_arr'],
+        case['output_MLR_arr'],
+        case['output_HRR_wood_arr'],
+        case['output_HRR_total_arr'],
+        case['output_HRR_ext_arr'],
+        HRR_time_arr,
+        HRR_hrr_arr,
+    )
 
-        # Openings: convective & radiative losses
-        Q_o_c = q_o_c_calc(H_o, opening_area, c_p, T_f, T_inf)
-        Q_o_r = q_o_r_calc(opening_area, Ef, T_f, Tinf=0.0)
 
-        # Heat loss to walls
-        Q_w_walls = q_w(T_f, Ts_wall, hc, E_net) * wall_area
-        Q_w_ceiling = q_w(T_f, Ts_ceil, hc, E_net) * ceiling_area
-        Q_w_floor = q_w(T_f, Ts_floor, hc, E_net) * floor_area
-        Q_w_total = Q_w_walls + Q_w_ceiling + Q_w_floor
-
-        # Gas energy balance & temperature update
-        Q_gas = gas_energy_balance(HRR_conv, Q_w_total, Q_o_c, Q_o_r)
-        dT_gas = delta_gas_temp(Q_gas, dt, rho_air, c_p, gas_volume)
-        T_f = max(293.0, T_f + dT_gas)
+@njit(parallel=True, cache=True)
+def _simulate_sweep(
+        n_steps: np.ndarray, T_f: np.ndarray, sizes: np.ndarray, scalars: np.ndarray,
+        HRR_at_step: np.ndarray, Reg_rate_at_step: np.ndarray,
+        T: np.ndarray, T_ceil: np.ndarray, T_floor: np.ndarray, outputs: np.ndarray,
+):
+    """
+    Advance every case of a sweep over its full duration, distributing cases across threads.
 
-        # Store results
-        output_time_arr.append(time_s)
-        output_gas_temp_arr.append(T_f)
-
-        # Compute char depth
-        output_time_arr_min = [x / 60.0 for x in output_time_arr]
-        output_char_depth_arr = np.append(
-            output_char_depth_arr,
-            char_depth_integral(output_gas_temp_arr, output_time_arr_min)
+    Each leading index selects one case; ``sizes`` holds ``(N, N_ceil, N_floor)`` per case, ``scalars`` the
+    :data:`_KERNEL_SCALARS` per case and ``outputs`` the eight ``output_*`` arrays of :func:`_simulate_core`
+    stacked on its first axis.
+    """
+    for j in prange(n_steps.shape[0]):
+        N, N_ceil, N_floor = sizes[j, 0], sizes[j, 1], sizes[j, 2]
+        p = scalars[j]
+        _simulate_core(
+            1, n_steps[j] + 1, T_f[j], 0.0, 0.0, 0.0,
+            T[j, :, :N], T_ceil[j, :, :N_ceil], T_floor[j, :, :N_floor],
+            outputs[0, j], outputs[1, j], outputs[2, j], outputs[3, j],
+            outputs[4, j], outputs[5, j], outputs[6, j], outputs[7, j],
+            HRR_at_step[j], Reg_rate_at_step[j],
+            N, N_ceil, N_floor,
+            p[0], p[1], p[2], p[3], p[4], p[5], p[6],
+            p[7], p[8], p[9], p[10], p[11], p[12], p[13],
+            p[14], p[15], p[16], p[17], p[18], p[19], p[20],
+            p[21], p[22], p[23], p[24],
         )
-        # Smooth char depth array
-        output_char_depth_arr = gaussian_filter1d(output_char_depth_arr, sigma=1.5)
 
-        if time_s < ceiling_ignition_time:
-            charring_rate = 0.0
-        else:
-            charring_rate = (output_char_depth_arr[i] - output_char_depth_arr[i - 1]) / (dt / 60.0)
-            # Update char density
-            char_rho = char_density(output_char_depth_arr[i])
-        output_charring_rate_arr.append(charring_rate)
 
-        # Mass loss rate
-        MLR = (charring_rate / (60.0 * 1000.0)) * wood_density
-        output_MLR_arr.append(MLR)
+def run_sweep(**params) -> tuple[np.ndarray, ...]:
+    """
+    Run :func:`main` for every case of a parameter sweep, solving the cases in parallel.
+
+    Each keyword is a :func:`main` parameter, given either as a scalar applied to
+    all cases or as a 1D array with one value per case; parameters not given take
+    the :func:`main` defaults. Pre-processing runs in Python case by case, then
+    the time-stepping of all cases runs in one Numba ``prange`` loop. The number
+    of threads is set by the ``NUMBA_NUM_THREADS`` environment variable, which
+    defaults to the number of CPU cores.
+
+    :param params: :func:`main` parameters, as scalars or arrays of length n_cases.
+    :returns: A tuple of 2D arrays of shape (n_cases, max_steps + 1) in the order
+              of the first eight :func:`main` outputs (time_arr [min] to
+              HRR_external_arr [W]). Cases with fewer time steps are padded with NaN.
+    """
+    defaults = {name: param.default for name, param in inspect.signature(main).parameters.items()}
+    unknown = sorted(set(params) - set(defaults))
+    if unknown:
+        raise TypeError(f"run_sweep() got unexpected parameters: {', '.join(unknown)}")
+
+    shape = np.broadcast_shapes(*(np.shape(value) for value in params.values()))
+    if len(shape) > 1:
+        raise ValueError("run_sweep() parameters must be scalars or 1D arrays")
+    n_cases = shape[0] if shape else 1
+    columns = {name: np.broadcast_to(value, (n_cases,)) for name, value in params.items()}
+
+    # Pre-process each case
+    case_params = []
+    cases = []
+    for j in range(n_cases):
+        case_params.append({**defaults, **{name: column[j].item() for name, column in columns.items()}})
+        cases.append(_prepare_case(**case_params[j])[0])
+
+    # Pack the cases into arrays indexed by case
+    n_steps = np.array([case['n_steps'] for case in cases])
+    sizes = np.array([[case['N'], case['N_ceil'], case['N_floor']] for case in cases])
+    scalars = np.array([[case[name] for name in _KERNEL_SCALARS] for case in cases])
+    T_f = np.array([case['T_f'] for case in cases])
+
+    n_max = n_steps.max() + 1
+    HRR_at_step = np.zeros((n_cases, n_max))
+    Reg_rate_at_step = np.zeros((n_cases, n_max))
+    outputs = np.full((8, n_cases, n_max), np.nan)
+    T = np.empty((n_cases, 2, sizes[:, 0].max()))
+    T_ceil = np.empty((n_cases, 2, sizes[:, 1].max()))
+    T_floor = np.empty((n_cases, 2, sizes[:, 2].max()))
+    for j, case in enumerate(cases):
+        HRR_at_step[j, :n_steps[j] + 1] = case['HRR_at_step']
+        Reg_rate_at_step[j, :n_steps[j] + 1] = case['Reg_rate_at_step']
+        outputs[:, j, 0] = (0.0, T_f[j], 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        T[j, :, :sizes[j, 0]] = case['T']
+        T_ceil[j, :, :sizes[j, 1]] = case['T_ceil']
+        T_floor[j, :, :sizes[j, 2]] = case['T_floor']
+
+    _simulate_sweep(
+        n_steps, T_f, sizes, scalars, HRR_at_step, Reg_rate_at_step,
+        T, T_ceil, T_floor, outputs,
+    )
 
-        # Store HRR data
-        output_HRR_wood_arr.append(HRR_wood)
-        output_HRR_total_arr.append(HRR_total)
-        output_HRR_ext_arr.append(HRR_ext)
+    # Smooth char depth arrays
+    for j in range(n_cases):
+        outputs[2, j, :n_steps[j] + 1] = gaussian_filter1d(outputs[2, j, :n_steps[j] + 1], sigma=1.5)
 
-    # Plot output
-    output_time_arr = [x / 60 for x in output_time_arr]
-    output_gas_temp_arr = [x - 273 for x in output_gas_temp_arr]
-    HRR_time_arr = [x / 60 for x in HRR_time_arr]
+    outputs[0] /= 60.0
+    outputs[1] -= 273.0
 
-    return (
-        output_time_arr,
-        output_gas_temp_arr,
-        output_char_depth_arr,
-        output_charring_rate_arr,
-        output_MLR_arr,
-        output_HRR_wood_arr,
-        output_HRR_total_arr,
-        output_HRR_ext_arr,
-        HRR_time_arr,
-        HRR_hrr_arr,
-    )
+    return tuple(outputs)
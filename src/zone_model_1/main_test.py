@@ -18,15 +18,13 @@ if __name__ == "__main__":
     import matplotlib.pyplot as plt
 
     # Convert HRR arrays to kW
-    HRR_hrr_arr = [x / 1000 for x in HRR_hrr_arr]
-    output_HRR_wood_arr = [x / 1000 for x in output_HRR_wood_arr]
-    output_HRR_total_arr = [x / 1000 for x in output_HRR_total_arr]
-    output_HRR_ext_arr = [x / 1000 for x in output_HRR_ext_arr]
+    HRR_hrr_arr = HRR_hrr_arr / 1000
+    output_HRR_wood_arr = output_HRR_wood_arr / 1000
+    output_HRR_total_arr = output_HRR_total_arr / 1000
+    output_HRR_ext_arr = output_HRR_ext_arr / 1000
 
     # Generate new array for Total HRR
-    combined_HRR =[]
-    for i in range(len(output_HRR_total_arr)):
-        combined_HRR.append(output_HRR_total_arr[i] + output_HRR_ext_arr[i])
+    combined_HRR = output_HRR_total_arr + output_HRR_ext_arr
 
     plt.style.use('seaborn-v0_8-whitegrid')
     fig, ax1 = plt.subplots()
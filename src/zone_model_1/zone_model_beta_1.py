@@ -1,10 +1,9 @@
 if __name__ == "__main__":
     import matplotlib.pyplot as plt
-    from scipy.interpolate import interp1d
     from scipy.ndimage import gaussian_filter1d
 
     import zone_model_1.hrr as RHR
-    from zone_model_1.charring import char_depth_integral
+    from zone_model_1.charring import char_depth_from_integral, char_integral_increment
     from zone_model_1.heat_transfer_1d_plus_qinc import alpha_calc, ht_dx_dt_sub, update_wall_temp_array
     from zone_model_1.core import *
 
@@ -50,15 +49,20 @@ if __name__ == "__main__":
     # Define spatial and time steps
     dx, dt = ht_dx_dt_sub(L, N, alpha)
     steps = End_time / dt
-    print(round(steps))
+    n_steps = round(steps)
+    print(n_steps)
+    r = alpha * dt / (dx * dx)
+    coef = dt / (rho * c * dx)
 
     # Initialise temperature array in Kelvin
     T = np.ones(N) * T0_wall  # Initial temperature distribution
     T_new = T.copy()  # Array for updated temperatures
 
     # Record temperature profiles over time for visualization
-    T_history = []
-    T_wall_surf = []
+    T_history = np.empty((n_steps + 1, N))
+    T_history[0] = T
+    T_wall_surf = np.empty(n_steps + 1)
+    T_wall_surf[0] = T[0]
 
     # Calculate initial geometrical variables
     opening_area = H_o * B_o
@@ -66,39 +70,45 @@ if __name__ == "__main__":
     ceiling_area = b * d
     floor_area = b * d
     gas_volume = b * d * h
+    total_surface_area = wall_area + ceiling_area + floor_area
 
     # Define relationship between HRR and time
-    HRR_time_arr, HRR_hrr_arr = RHR.time_vs_hrr(b, d, h, H_o, B_o, HRRPUA, growth_rate, FLED)
-    HRR_hrr_arr = [x * 1000 for x in HRR_hrr_arr]  # Convert to Watts
-    HRR_interp = interp1d(HRR_time_arr, HRR_hrr_arr)  # Interpolation function
+    HRR_time_arr, HRR_hrr_arr, *_ = RHR.time_vs_hrr(b, d, h, H_o, B_o, HRRPUA, growth_rate, FLED, conv_fract)
+    HRR_time_arr = np.asarray(HRR_time_arr, dtype=np.float64)
+    HRR_hrr_arr = np.asarray(HRR_hrr_arr, dtype=np.float64) * 1000  # Convert to Watts
     HRR_VC_lim = RHR.vent_cont_hrr(opening_area, H_o) * 1000
 
+    # Sample the contents HRR once at every time step
+    HRR_at_step = np.interp(np.arange(n_steps + 1) * dt, HRR_time_arr, HRR_hrr_arr)
+
     # Create output storage arrays
-    output_time_arr = []
-    output_gas_temp_arr = []
-    output_char_depth_arr = np.array([0])
-    output_charring_rate_arr = []
-    output_MLR_arr = []
-    output_HRR_wood_arr = []
-    output_HRR_total_arr = []
-    output_HRR_ext_arr = []
+    output_time_arr = np.empty(n_steps + 1)
+    output_gas_temp_arr = np.empty(n_steps + 1)
+    output_char_depth_arr = np.empty(n_steps + 1)
+    output_charring_rate_arr = np.empty(n_steps + 1)
+    output_MLR_arr = np.empty(n_steps + 1)
+    output_HRR_wood_arr = np.empty(n_steps + 1)
+    output_HRR_total_arr = np.empty(n_steps + 1)
+    output_HRR_ext_arr = np.empty(n_steps + 1)
 
     # Populate storage arrays with initial values
-    output_time_arr.append(0)
-    output_gas_temp_arr.append(Tf)
-    output_charring_rate_arr.append(0)
-    output_MLR_arr.append(0)
-    output_HRR_wood_arr.append(0)
-    output_HRR_total_arr.append(0)
-    output_HRR_ext_arr.append(0)
+    output_time_arr[0] = 0
+    output_gas_temp_arr[0] = Tf
+    output_char_depth_arr[0] = 0
+    output_charring_rate_arr[0] = 0
+    output_MLR_arr[0] = 0
+    output_HRR_wood_arr[0] = 0
+    output_HRR_total_arr[0] = 0
+    output_HRR_ext_arr[0] = 0
 
     # Initialisation variables
     MLR = 0
+    T2_integral = 0.0  # Running integral of gas temperature squared over time in minutes
 
     # Resolve energy balance
-    for i in range(1, round(steps) + 1, 1):
+    for i in range(1, n_steps + 1, 1):
         time = i * dt
-        HRR_content = HRR_interp(time)
+        HRR_content = HRR_at_step[i]
         HRR_wood = MLR * wood_Hoc * ceiling_area * ceiling_exposed * 1000
 
         HRR_total = HRR_wood + HRR_content
@@ -111,53 +121,55 @@ if __name__ == "__main__":
 
         q_rad_wall = wall_rad_hf(gas_volume, (1 - conv_fract), HRR) * (1 - Ef)
 
-        T = update_wall_temp_array(T, T_new, T_history, alpha, dt, dx, hc, Tf, E_net, sigma, rho, c, N, q_rad_wall)
+        update_wall_temp_array(T, T_new, r, coef, hc, Tf, E_net, sigma, N, q_rad_wall)
+        T, T_new = T_new, T
+        T_history[i] = T
         Tw = T[0]
 
         Q_o_c = q_o_c_calc(H_o, opening_area, c_p, Tf, Tinf)
         Q_o_r = q_o_r_calc(opening_area, Ef, Tf, Tinf=0)
-        Q_w_walls = q_w(Tf, Tw, hc, E_net) * wall_area
-        Q_w_ceiling = q_w(Tf, Tw, hc, E_net) * ceiling_area
-        Q_w_floor = q_w(Tf, Tw, hc, E_net) * floor_area
-        Q_w = Q_w_walls + Q_w_ceiling + Q_w_floor
+        # All surfaces share the single wall temperature, so evaluate the flux once
+        Q_w = q_w(Tf, Tw, hc, E_net) * total_surface_area
 
         Q_gas = gas_energy_balance(HRR, Q_w, Q_o_c, Q_o_r)
         dT_gas = delta_gas_temp(Q_gas, dt, rho_air, c_p, gas_volume)
+        Tf_prev = Tf
         Tf = Tf + dT_gas
         Tf = max(293, Tf)
 
-        output_time_arr.append(time)
-        output_gas_temp_arr.append(Tf)
-        T_wall_surf.append(T[0])
+        output_time_arr[i] = time
+        output_gas_temp_arr[i] = Tf
+        T_wall_surf[i] = T[0]
 
-        # Get char depth
-        output_time_arr_min = [x / 60 for x in output_time_arr]
-        output_char_depth_arr = np.append(output_char_depth_arr,
-                                          char_depth_integral(output_gas_temp_arr, output_time_arr_min))
-        output_char_depth_arr = gaussian_filter1d(output_char_depth_arr, sigma=1.5)
+        # Get char depth, adding this step's trapezoid to the running integral
+        T2_integral += char_integral_increment(Tf_prev, Tf, dt / 60)
+        output_char_depth_arr[i] = char_depth_from_integral(T2_integral)
 
         if Tf < 300 + 273 and time < 60:
             charring_rate = 0
         else:
             charring_rate = (output_char_depth_arr[i] - output_char_depth_arr[i - 1]) / (dt / 60)
-        output_charring_rate_arr.append(charring_rate)
+        output_charring_rate_arr[i] = charring_rate
 
         MLR = (charring_rate / (60 * 1000)) * wood_density
-        output_MLR_arr.append(MLR)
-        output_HRR_wood_arr.append(HRR_wood)
-        output_HRR_total_arr.append(HRR_total)
-        output_HRR_ext_arr.append(HRR_ext)
+        output_MLR_arr[i] = MLR
+        output_HRR_wood_arr[i] = HRR_wood
+        output_HRR_total_arr[i] = HRR_total
+        output_HRR_ext_arr[i] = HRR_ext
 
         print(
             "Solving..........   Step = ", i, " Time = ", time, " s", " HRR = ", HRR / 1000, " Gas temp = ", Tf,
             'Incident HF to walls = ', q_rad_wall
         )
 
+    # Smooth char depth array once, the charring rate above uses the raw values
+    output_char_depth_arr = gaussian_filter1d(output_char_depth_arr, sigma=1.5)
+
     # Plot output
-    output_time_arr = [x / 60 for x in output_time_arr]
-    output_gas_temp_arr = [x - 273 for x in output_gas_temp_arr]
-    T_wall_surf = [x - 273 for x in T_wall_surf]
-    HRR_time_arr = [x / 60 for x in HRR_time_arr]
+    output_time_arr = output_time_arr / 60
+    output_gas_temp_arr = output_gas_temp_arr - 273
+    T_wall_surf = T_wall_surf - 273
+    HRR_time_arr = HRR_time_arr / 60
 
     fig, ax1 = plt.subplots()
     ax1.plot(output_time_arr, output_gas_temp_arr, label='Gas')
@@ -1,4 +1,4 @@
-from src.zone_model_1.charring import *
+from zone_model_1.charring import *
 
 
 def test_1():
@@ -8,3 +8,24 @@ def test_1():
     integral = char_depth_integral(temp_list, time_list)
     assert abs(char_depth_integral(temp_list, time_list) - 49.617272031154265) < 1e-6, 'Unmatched char depth integral'
     print(integral)
+
+
+def test_char_depth_from_integral():
+    # d_char = (integral / 1.35e5) ** (1 / 1.6)
+    assert char_depth_from_integral(1.35e5) == 1.0, 'Unmatched char depth from integral'
+    assert abs(char_depth_from_integral(1.35e5 * 2.0 ** 1.6) - 2.0) < 1e-12, 'Unmatched char depth from integral'
+
+
+def test_char_integral_increment():
+    # Linear temperature rise T = a + b * t, so T^2 is quadratic and the composite trapezoidal rule
+    # overestimates the exact integral by exactly (t_end - t_start) * h^2 * (2 * b^2) / 12
+    a, b = 293.0, 10.0
+    t_end, h = 60.0, 1.0
+    N = round(t_end / h)
+    T2_integral = 0.0
+    for j in range(1, N + 1):
+        T2_integral += char_integral_increment(a + b * (j - 1) * h, a + b * j * h, h)
+    exact = ((a + b * t_end) ** 3 - a ** 3) / (3.0 * b)
+    expected = exact + t_end * h * h * 2.0 * b * b / 12.0
+    # Only floating point rounding differs from the closed form
+    assert abs(T2_integral - expected) < 1e-12 * expected, 'Unmatched accumulated integral'
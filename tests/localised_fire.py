@@ -0,0 +1,26 @@
+import numpy as np
+
+from zone_model_1.localised_fire import get_localised_fire, get_localised_fire_batch
+
+
+def test_get_localised_fire_batch():
+    HRRPUA = 250000
+    conv_fract = 0.7
+    HRR_arr = np.array([5e5, 1e6, 2e6, 4e6])
+    z_arr = np.array([[0.5], [1.2], [2.4]])
+    lf, local_temp = get_localised_fire_batch(HRR_arr, HRRPUA, conv_fract, z_arr)
+    assert lf.shape == local_temp.shape == (3, 4), 'Unexpected broadcast shape'
+    for i, z in enumerate(z_arr[:, 0]):
+        for j, HRR in enumerate(HRR_arr):
+            lf_ij, local_temp_ij = get_localised_fire(HRR, HRRPUA, conv_fract, z)
+            assert abs(lf[i, j] - lf_ij) < 1e-12, 'Unmatched flame length'
+            assert abs(local_temp[i, j] - local_temp_ij) < 1e-9, 'Unmatched local flame temperature'
+    assert np.any(local_temp == 900.0), 'Temperature cap not exercised'
+
+    # Results are independent, writable arrays
+    lf[...] = 0.0
+    local_temp[...] = 0.0
+
+    # Scalar inputs give 0-d arrays for both outputs
+    lf, local_temp = get_localised_fire_batch(2e6, HRRPUA, conv_fract, 1.2)
+    assert lf.shape == local_temp.shape == (), 'Unexpected scalar shape'
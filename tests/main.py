@@ -0,0 +1,67 @@
+import inspect
+import os
+
+import numpy as np
+import pandas as pd
+
+import zone_model_1
+from zone_model_1.charring import char_depth_integral, standard_fire_curve
+from zone_model_1.core import q_w
+from zone_model_1.main import _KERNEL_SCALARS, _simulate_core, main, run_sweep
+
+
+def test_main(monkeypatch):
+    package_dir = os.path.dirname(zone_model_1.__file__)
+
+    # Compile and cache shared Numba helpers through the package import path before main() uses them
+    temp_list = [standard_fire_curve(x) for x in range(1, 61)]
+    char_depth_integral(temp_list, list(range(1, 61)))
+    q_w(1000.0, 293.0, 35.0, 0.7)
+
+    # Input.xlsx is read relative to the working directory
+    monkeypatch.chdir(package_dir)
+    outputs = main()
+    assert len(outputs) == 10, 'Unexpected number of outputs'
+    n = len(outputs[0])
+    for output in outputs[:8]:
+        assert output.shape == (n,), 'Unmatched output length'
+        assert np.all(np.isfinite(output)), 'Non-finite output'
+    assert abs(outputs[0][-1] - 180.0) < 0.1, 'Unexpected end time'
+
+    # Compare with the reference results written by main_test.py
+    df = pd.read_csv(os.path.join(package_dir, 'zone_model_out.csv'))
+    assert len(df) == n, 'Unmatched number of time steps'
+    time_arr, gas_temp_arr, _, _, _, HRR_wood_arr, HRR_total_arr, HRR_ext_arr, _, _ = outputs
+    for column, output in (
+            ('Output time [min]', time_arr),
+            ('Output Gas Temp [DegC]', gas_temp_arr),
+            ('Output HRR from wood [kW]', HRR_wood_arr / 1000),
+            ('Output HRR inside enclosure [kW]', HRR_total_arr / 1000),
+            ('Output HRR external to enclosure [kW]', HRR_ext_arr / 1000),
+    ):
+        expected = df[column].to_numpy()
+        scale = np.max(np.abs(expected))
+        np.testing.assert_allclose(output, expected, rtol=1e-6, atol=1e-6 * scale, err_msg=column)
+
+
+def test_run_sweep(monkeypatch):
+    monkeypatch.chdir(os.path.dirname(zone_model_1.__file__))
+    case_params = [dict(b=3.4, N=51), dict(b=4.0, N=41), dict(b=5.0, N=61)]
+    outputs = run_sweep(b=[case['b'] for case in case_params], N=[case['N'] for case in case_params])
+    assert len(outputs) == 8, 'Unexpected number of outputs'
+    for j, case in enumerate(case_params):
+        expected = main(**case)
+        n = len(expected[0])
+        for output, expected_output in zip(outputs, expected[:8]):
+            # fastmath may contract floating point operations differently once the kernel is inlined in the
+            # parallel sweep, so agreement is to rounding relative to each output's scale rather than bitwise
+            scale = np.max(np.abs(expected_output))
+            np.testing.assert_allclose(output[j, :n], expected_output, rtol=1e-9, atol=1e-9 * scale)
+            assert np.all(np.isnan(output[j, n:])), 'Padding is not NaN'
+
+
+def test_kernel_scalars_order():
+    # _simulate_sweep passes the scalars by position, so their order must match the kernel signature
+    parameters = tuple(inspect.signature(_simulate_core.py_func).parameters)
+    assert parameters[-len(_KERNEL_SCALARS):] == _KERNEL_SCALARS, \
+        '_KERNEL_SCALARS does not match the trailing arguments of _simulate_core'